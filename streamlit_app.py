@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
-from datetime import datetime, timedelta, date
-from typing import Union, List, Dict, Any, Optional, Tuple
+import numpy as np
+from datetime import timedelta, date
+from typing import Union, List, Dict, Any, Optional, Tuple, Callable
 import re
+import functools
+from collections import namedtuple
 
 # Configure the page
 st.set_page_config(
@@ -16,33 +18,39 @@ st.set_page_config(
 
 def format_currency(amount: Union[float, int], show_symbol: bool = True) -> str:
     """Format amount in Indian currency format with ₹ symbol"""
-    if amount == 0:
-        return "₹0" if show_symbol else "0"
-    
     try:
         amount = float(amount)
-        is_negative = amount < 0
-        amount = abs(amount)
-        
-        if amount >= 10000000:  # 1 crore
-            crores = amount / 10000000
-            formatted = f"{crores:,.2f}".rstrip('0').rstrip('.') + " Cr"
-        elif amount >= 100000:  # 1 lakh
-            lakhs = amount / 100000
-            formatted = f"{lakhs:,.2f}".rstrip('0').rstrip('.') + " L"
-        else:
-            formatted = f"{amount:,.2f}".rstrip('0').rstrip('.')
-        
-        if show_symbol:
-            formatted = "₹" + formatted
-        
-        if is_negative:
-            formatted = "-" + formatted
-        
-        return formatted
-        
     except (ValueError, TypeError):
         return "₹0" if show_symbol else "0"
+    
+    # NaN never equals itself, so it would only ever miss the cache
+    if amount != amount:
+        return _format_currency(amount, show_symbol)
+    
+    return _format_currency_cached(amount, show_symbol)
+
+def _format_currency(amount: float, show_symbol: bool) -> str:
+    if amount == 0:
+        return "₹0" if show_symbol else "0"
+    
+    prefix = ("-" if amount < 0 else "") + ("₹" if show_symbol else "")
+    amount = abs(amount)
+    
+    if amount >= 10000000:  # 1 crore
+        value, suffix = amount / 10000000, " Cr"
+    elif amount >= 100000:  # 1 lakh
+        value, suffix = amount / 100000, " L"
+    else:
+        value, suffix = amount, ""
+    
+    # Whole amounts (the common case) skip the ",.2f" + zero-stripping path
+    if value.is_integer():
+        return f"{prefix}{int(value):,}{suffix}"
+    
+    body = f"{value:,.2f}".rstrip('0').rstrip('.')
+    return f"{prefix}{body}{suffix}"
+
+_format_currency_cached = functools.lru_cache(maxsize=1024)(_format_currency)
 
 def validate_positive_number(value: Union[float, int, str], 
                            field_name: str = "Value",
@@ -62,6 +70,12 @@ def validate_positive_number(value: Union[float, int, str],
     except (ValueError, TypeError):
         return False, f"❌ {field_name} must be a valid number"
 
+# Indian GST slabs; purchase/sales entries don't offer the exempt 0% slab
+_GST_RATES = (0, 5, 12, 18, 28)
+_GST_RATE_CHOICES = (5, 12, 18, 28)
+_VALID_GST_RATES = frozenset(_GST_RATES)
+_VALID_GST_RATES_STR = ", ".join(map(str, _GST_RATES))
+
 def validate_gst_rate(rate: Union[float, int]) -> Tuple[bool, str]:
     """Validate GST rate according to Indian GST structure"""
     try:
@@ -73,32 +87,39 @@ def validate_gst_rate(rate: Union[float, int]) -> Tuple[bool, str]:
         if rate > 28:
             return False, "❌ GST rate cannot exceed 28%"
         
-        valid_rates = [0, 5, 12, 18, 28]
-        if rate not in valid_rates:
-            return False, f"❌ Invalid GST rate. Valid rates are: {', '.join(map(str, valid_rates))}%"
+        if rate not in _VALID_GST_RATES:
+            return False, f"❌ Invalid GST rate. Valid rates are: {_VALID_GST_RATES_STR}%"
         
         return True, ""
         
     except (ValueError, TypeError):
         return False, "❌ GST rate must be a valid number"
 
+@functools.lru_cache(maxsize=512)
+def _split_gst(amount: float, rate: int) -> Tuple[float, float]:
+    """Split a GST inclusive amount into (basic amount, GST amount)"""
+    basic_amount = amount / (1 + rate/100)
+    return basic_amount, amount - basic_amount
+
+def show_section_tabs(sections: Dict[str, Callable[[], None]], key: str) -> None:
+    """Render only the selected section; st.tabs would run every tab body on each rerun"""
+    selected = st.radio("Section", list(sections), horizontal=True,
+                        label_visibility="collapsed", key=key)
+    sections[selected]()
+
 # ==================== ACCOUNTING EQUATIONS MODULE ====================
 
 def show_accounting_equations():
     st.header("📐 Accounting Equations Solver")
     st.markdown("**Fundamental Equation: Assets = Liabilities + Capital**")
     
-    tab1, tab2, tab3 = st.tabs(["🔍 Solve Equation", "📚 Learn Concepts", "📝 Practice Problems"])
-    
-    with tab1:
-        solve_accounting_equation()
-    
-    with tab2:
-        show_equation_concepts()
-    
-    with tab3:
-        show_equation_practice_problems()
+    show_section_tabs({
+        "🔍 Solve Equation": solve_accounting_equation,
+        "📚 Learn Concepts": show_equation_concepts,
+        "📝 Practice Problems": show_equation_practice_problems
+    }, key="equation_section")
 
+@st.fragment
 def solve_accounting_equation():
     st.subheader("Enter Known Values")
     
@@ -128,7 +149,8 @@ def solve_accounting_equation():
 
 def solve_equation(assets, liabilities, capital, drawings, additional_capital, profit_loss):
     try:
-        known_values = sum([x is not None and x != 0 for x in [assets, liabilities, capital]])
+        # 0 is a valid entry (min_value=0.0); only an empty input is unknown
+        known_values = (assets is not None) + (liabilities is not None) + (capital is not None)
         
         if known_values < 2:
             st.error("❌ Please provide at least 2 known values to solve the equation!")
@@ -139,6 +161,7 @@ def solve_equation(assets, liabilities, capital, drawings, additional_capital, p
         
         if capital is not None:
             adjusted_capital = capital + additional_capital - drawings + profit_loss
+            adj_cap_str = format_currency(adjusted_capital)
             st.markdown(f"""
             **Step 1: Adjust Capital**
             - Opening Capital: {format_currency(capital)}
@@ -146,10 +169,11 @@ def solve_equation(assets, liabilities, capital, drawings, additional_capital, p
             - Add: Profit: {format_currency(max(0, profit_loss))}
             - Less: Loss: {format_currency(abs(min(0, profit_loss)))}
             - Less: Drawings: {format_currency(drawings)}
-            - **Adjusted Capital: {format_currency(adjusted_capital)}**
+            - **Adjusted Capital: {adj_cap_str}**
             """)
         else:
             adjusted_capital = None
+            adj_cap_str = None
         
         st.markdown("**Step 2: Apply Accounting Equation**")
         st.markdown("**Assets = Liabilities + Capital**")
@@ -160,13 +184,13 @@ def solve_equation(assets, liabilities, capital, drawings, additional_capital, p
             if liabilities is not None and adjusted_capital is not None:
                 calculated_assets = liabilities + adjusted_capital
                 solution['Assets'] = calculated_assets
-                st.success(f"✅ **Assets = {format_currency(liabilities)} + {format_currency(adjusted_capital)} = {format_currency(calculated_assets)}**")
+                st.success(f"✅ **Assets = {format_currency(liabilities)} + {adj_cap_str} = {format_currency(calculated_assets)}**")
         
         elif liabilities is None:
             if assets is not None and adjusted_capital is not None:
                 calculated_liabilities = assets - adjusted_capital
                 solution['Liabilities'] = calculated_liabilities
-                st.success(f"✅ **Liabilities = {format_currency(assets)} - {format_currency(adjusted_capital)} = {format_currency(calculated_liabilities)}**")
+                st.success(f"✅ **Liabilities = {format_currency(assets)} - {adj_cap_str} = {format_currency(calculated_liabilities)}**")
         
         elif capital is None:
             if assets is not None and liabilities is not None:
@@ -177,11 +201,11 @@ def solve_equation(assets, liabilities, capital, drawings, additional_capital, p
                 st.success(f"✅ **Adjusted Capital = {format_currency(assets)} - {format_currency(liabilities)} = {format_currency(calculated_capital)}**")
                 st.success(f"✅ **Original Capital = {format_currency(original_capital)}**")
         
-        final_assets = assets or solution.get('Assets')
-        final_liabilities = liabilities or solution.get('Liabilities')
-        final_capital = adjusted_capital or solution.get('Adjusted Capital')
+        final_assets = assets if assets is not None else solution.get('Assets')
+        final_liabilities = liabilities if liabilities is not None else solution.get('Liabilities')
+        final_capital = adjusted_capital if adjusted_capital is not None else solution.get('Adjusted Capital')
         
-        if final_assets and final_liabilities and final_capital:
+        if final_assets is not None and final_liabilities is not None and final_capital is not None:
             st.markdown("**Step 3: Verification**")
             if abs(final_assets - (final_liabilities + final_capital)) < 0.01:
                 st.success(f"✅ **Verified: {format_currency(final_assets)} = {format_currency(final_liabilities)} + {format_currency(final_capital)}**")
@@ -196,41 +220,34 @@ def solve_equation(assets, liabilities, capital, drawings, additional_capital, p
 def create_equation_summary_table(assets, liabilities, capital, solution, adjusted_capital):
     st.markdown("### 📊 Summary")
     
-    summary_data = []
+    summary = {'Component': [], 'Amount (₹)': [], 'Status': []}
     
-    if assets or 'Assets' in solution:
-        summary_data.append({
-            'Component': 'Assets',
-            'Amount (₹)': format_currency(assets or solution['Assets']),
-            'Status': 'Given' if assets else 'Calculated'
-        })
+    def add_row(component, amount, status):
+        summary['Component'].append(component)
+        summary['Amount (₹)'].append(format_currency(amount))
+        summary['Status'].append(status)
     
-    if liabilities or 'Liabilities' in solution:
-        summary_data.append({
-            'Component': 'Liabilities', 
-            'Amount (₹)': format_currency(liabilities or solution['Liabilities']),
-            'Status': 'Given' if liabilities else 'Calculated'
-        })
+    # A given 0 is a real value, so test for None rather than truthiness
+    if assets is not None or 'Assets' in solution:
+        add_row('Assets', assets if assets is not None else solution['Assets'],
+                'Given' if assets is not None else 'Calculated')
     
-    if capital or 'Original Capital' in solution:
-        summary_data.append({
-            'Component': 'Capital (Original)',
-            'Amount (₹)': format_currency(capital or solution['Original Capital']),
-            'Status': 'Given' if capital else 'Calculated'
-        })
+    if liabilities is not None or 'Liabilities' in solution:
+        add_row('Liabilities', liabilities if liabilities is not None else solution['Liabilities'],
+                'Given' if liabilities is not None else 'Calculated')
     
-    if adjusted_capital or 'Adjusted Capital' in solution:
-        summary_data.append({
-            'Component': 'Capital (Adjusted)',
-            'Amount (₹)': format_currency(adjusted_capital or solution['Adjusted Capital']),
-            'Status': 'Calculated'
-        })
+    if capital is not None or 'Original Capital' in solution:
+        add_row('Capital (Original)', capital if capital is not None else solution['Original Capital'],
+                'Given' if capital is not None else 'Calculated')
+    
+    if adjusted_capital is not None or 'Adjusted Capital' in solution:
+        add_row('Capital (Adjusted)',
+                adjusted_capital if adjusted_capital is not None else solution['Adjusted Capital'],
+                'Calculated')
     
-    df = pd.DataFrame(summary_data)
-    st.table(df)
+    st.table(summary)
 
-def show_equation_concepts():
-    st.markdown("""
+_EQUATION_CONCEPTS_MD = """
     ## 📚 Accounting Equation Concepts
     
     ### Basic Equation
@@ -262,34 +279,39 @@ def show_equation_concepts():
     | Payment to creditor | -₹ | -₹ | - |
     | Drawings | -₹ | - | -₹ |
     | Profit earned | +₹ | - | +₹ |
-    """)
+    """
+
+def show_equation_concepts():
+    st.markdown(_EQUATION_CONCEPTS_MD)
+
+_Problem = namedtuple('_Problem', 'title description solution')
+
+_EQ_PROBLEMS = (
+    _Problem(
+        "Problem 1: Find Missing Assets",
+        "Liabilities: ₹50,000, Capital: ₹1,50,000. Find Assets.",
+        "Assets = ₹50,000 + ₹1,50,000 = ₹2,00,000"
+    ),
+    _Problem(
+        "Problem 2: Find Missing Capital",
+        "Assets: ₹3,00,000, Liabilities: ₹75,000. Find Capital.",
+        "Capital = ₹3,00,000 - ₹75,000 = ₹2,25,000"
+    ),
+    _Problem(
+        "Problem 3: With Drawings and Profit",
+        "Opening Capital: ₹2,00,000, Profit: ₹50,000, Drawings: ₹30,000, Assets: ₹3,00,000. Find Liabilities.",
+        "Adjusted Capital = ₹2,00,000 + ₹50,000 - ₹30,000 = ₹2,20,000\nLiabilities = ₹3,00,000 - ₹2,20,000 = ₹80,000"
+    )
+)
 
 def show_equation_practice_problems():
     st.markdown("## 📝 Practice Problems")
     
-    problems = [
-        {
-            "title": "Problem 1: Find Missing Assets",
-            "description": "Liabilities: ₹50,000, Capital: ₹1,50,000. Find Assets.",
-            "solution": "Assets = ₹50,000 + ₹1,50,000 = ₹2,00,000"
-        },
-        {
-            "title": "Problem 2: Find Missing Capital", 
-            "description": "Assets: ₹3,00,000, Liabilities: ₹75,000. Find Capital.",
-            "solution": "Capital = ₹3,00,000 - ₹75,000 = ₹2,25,000"
-        },
-        {
-            "title": "Problem 3: With Drawings and Profit",
-            "description": "Opening Capital: ₹2,00,000, Profit: ₹50,000, Drawings: ₹30,000, Assets: ₹3,00,000. Find Liabilities.",
-            "solution": "Adjusted Capital = ₹2,00,000 + ₹50,000 - ₹30,000 = ₹2,20,000\nLiabilities = ₹3,00,000 - ₹2,20,000 = ₹80,000"
-        }
-    ]
-    
-    for i, problem in enumerate(problems, 1):
-        with st.expander(f"📚 {problem['title']}"):
-            st.markdown(f"**Problem:** {problem['description']}")
+    for i, problem in enumerate(_EQ_PROBLEMS, 1):
+        with st.expander(f"📚 {problem.title}"):
+            st.markdown(f"**Problem:** {problem.description}")
             if st.button(f"Show Solution", key=f"eq_solution_{i}"):
-                st.markdown(f"**Solution:**\n{problem['solution']}")
+                st.markdown(f"**Solution:**\n{problem.solution}")
 
 # ==================== JOURNAL ENTRIES MODULE ====================
 
@@ -297,35 +319,23 @@ def show_journal_entries():
     st.header("📝 Journal Entries Generator")
     st.markdown("**Record business transactions in proper journal format**")
     
-    tab1, tab2, tab3 = st.tabs(["✍️ Create Entry", "📚 Entry Types", "📖 Rules & Format"])
-    
-    with tab1:
-        create_journal_entry()
-    
-    with tab2:
-        show_journal_entry_types()
-    
-    with tab3:
-        show_journal_rules()
+    show_section_tabs({
+        "✍️ Create Entry": create_journal_entry,
+        "📚 Entry Types": show_journal_entry_types,
+        "📖 Rules & Format": show_journal_rules
+    }, key="journal_section")
 
+@st.fragment
 def create_journal_entry():
     st.subheader("Transaction Details")
     
     col1, col2 = st.columns(2)
     
     with col1:
-        entry_date = st.date_input("Date", value=datetime.now())
+        entry_date = st.date_input("Date", value=date.today())
         transaction_type = st.selectbox(
             "Transaction Type",
-            [
-                "Cash/Bank Transaction",
-                "Purchase Transaction", 
-                "Sales Transaction",
-                "Expense Transaction",
-                "Income Transaction",
-                "Capital Transaction",
-                "Custom Entry"
-            ]
+            [*_TXN_HANDLERS, "Custom Entry"]
         )
     
     with col2:
@@ -340,20 +350,9 @@ def create_journal_entry():
 
 def create_predefined_entry(transaction_type, entry_date, amount, narration):
     st.subheader("Transaction Specific Details")
-    
-    if transaction_type == "Cash/Bank Transaction":
-        handle_cash_bank_transaction(entry_date, amount, narration)
-    elif transaction_type == "Purchase Transaction":
-        handle_purchase_transaction(entry_date, amount, narration)
-    elif transaction_type == "Sales Transaction":
-        handle_sales_transaction(entry_date, amount, narration)
-    elif transaction_type == "Expense Transaction":
-        handle_expense_transaction(entry_date, amount, narration)
-    elif transaction_type == "Income Transaction":
-        handle_income_transaction(entry_date, amount, narration)
-    elif transaction_type == "Capital Transaction":
-        handle_capital_transaction(entry_date, amount, narration)
+    _TXN_HANDLERS[transaction_type](entry_date, amount, narration)
 
+@st.fragment
 def handle_cash_bank_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -396,6 +395,7 @@ def handle_cash_bank_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+@st.fragment
 def handle_purchase_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -409,14 +409,13 @@ def handle_purchase_transaction(entry_date, amount, narration):
         
         include_gst = st.checkbox("Include GST")
         if include_gst:
-            gst_rate = st.selectbox("GST Rate (%)", [5, 12, 18, 28], index=2)
+            gst_rate = st.selectbox("GST Rate (%)", _GST_RATE_CHOICES, index=2)
     
     if st.button("📝 Generate Purchase Entry", type="primary"):
         entries = []
         
         if include_gst:
-            basic_amount = amount / (1 + gst_rate/100)
-            gst_amount = amount - basic_amount
+            basic_amount, gst_amount = _split_gst(amount, gst_rate)
             
             entries.append({
                 'Account': f"{goods_type} Purchase",
@@ -450,6 +449,7 @@ def handle_purchase_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+@st.fragment
 def handle_sales_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -463,7 +463,7 @@ def handle_sales_transaction(entry_date, amount, narration):
         
         include_gst = st.checkbox("Include GST", key="sales_gst")
         if include_gst:
-            gst_rate = st.selectbox("GST Rate (%)", [5, 12, 18, 28], index=2, key="sales_gst_rate")
+            gst_rate = st.selectbox("GST Rate (%)", _GST_RATE_CHOICES, index=2, key="sales_gst_rate")
     
     if st.button("📝 Generate Sales Entry", type="primary"):
         entries = []
@@ -482,8 +482,7 @@ def handle_sales_transaction(entry_date, amount, narration):
             })
         
         if include_gst:
-            basic_amount = amount / (1 + gst_rate/100)
-            gst_amount = amount - basic_amount
+            basic_amount, gst_amount = _split_gst(amount, gst_rate)
             
             entries.append({
                 'Account': f"To {goods_type} Sales",
@@ -504,6 +503,7 @@ def handle_sales_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+@st.fragment
 def handle_expense_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -544,6 +544,7 @@ def handle_expense_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+@st.fragment
 def handle_income_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -575,6 +576,7 @@ def handle_income_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+@st.fragment
 def handle_capital_transaction(entry_date, amount, narration):
     col1, col2 = st.columns(2)
     
@@ -617,12 +619,25 @@ def handle_capital_transaction(entry_date, amount, narration):
         
         display_journal_entry(entry_date, entries, narration)
 
+# Predefined transaction types, in the order they are offered in the selector
+_TXN_HANDLERS = {
+    "Cash/Bank Transaction": handle_cash_bank_transaction,
+    "Purchase Transaction": handle_purchase_transaction,
+    "Sales Transaction": handle_sales_transaction,
+    "Expense Transaction": handle_expense_transaction,
+    "Income Transaction": handle_income_transaction,
+    "Capital Transaction": handle_capital_transaction
+}
+
+@st.fragment
 def create_custom_journal_entry(entry_date, amount, narration):
     st.subheader("Custom Journal Entry")
     
-    # Initialize session state for custom entries
+    # Initialize session state for custom entries as parallel columns
     if 'custom_entries' not in st.session_state:
-        st.session_state.custom_entries = []
+        st.session_state.custom_entries = {'accounts': [], 'dr': [], 'cr': []}
+    
+    custom = st.session_state.custom_entries
     
     col1, col2, col3 = st.columns(3)
     
@@ -637,33 +652,32 @@ def create_custom_journal_entry(entry_date, amount, narration):
     
     if st.button("➕ Add Entry"):
         if account_name and entry_amount > 0:
-            entry = {
-                'Account': account_name,
-                'Dr_Amount': entry_amount if entry_type == "Debit" else 0,
-                'Cr_Amount': entry_amount if entry_type == "Credit" else 0
-            }
-            st.session_state.custom_entries.append(entry)
+            custom['accounts'].append(account_name)
+            custom['dr'].append(entry_amount if entry_type == "Debit" else 0)
+            custom['cr'].append(entry_amount if entry_type == "Credit" else 0)
             st.success(f"✅ Added {entry_type} entry for {account_name}")
-            st.rerun()
+            st.rerun(scope="fragment")
     
-    if st.session_state.custom_entries:
+    if custom['accounts']:
+        dr_arr = np.asarray(custom['dr'], dtype=np.float64)
+        cr_arr = np.asarray(custom['cr'], dtype=np.float64)
+        
         st.subheader("Current Entries")
-        for i, entry in enumerate(st.session_state.custom_entries):
-            col1, col2, col3 = st.columns([3, 2, 1])
+        for i, account in enumerate(custom['accounts']):
+            col1, col2 = st.columns([5, 1])
             with col1:
-                st.write(f"{entry['Account']}")
-            with col2:
-                if entry['Dr_Amount'] > 0:
-                    st.write(f"Dr: {format_currency(entry['Dr_Amount'])}")
+                if dr_arr[i] > 0:
+                    st.write(f"{account} — Dr: {format_currency(dr_arr[i])}")
                 else:
-                    st.write(f"Cr: {format_currency(entry['Cr_Amount'])}")
-            with col3:
+                    st.write(f"{account} — Cr: {format_currency(cr_arr[i])}")
+            with col2:
                 if st.button("🗑️", key=f"del_{i}"):
-                    st.session_state.custom_entries.pop(i)
-                    st.rerun()
+                    for column in custom.values():
+                        column.pop(i)
+                    st.rerun(scope="fragment")
         
-        total_dr = sum(entry['Dr_Amount'] for entry in st.session_state.custom_entries)
-        total_cr = sum(entry['Cr_Amount'] for entry in st.session_state.custom_entries)
+        total_dr = float(dr_arr.sum())
+        total_cr = float(cr_arr.sum())
         
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -678,61 +692,51 @@ def create_custom_journal_entry(entry_date, amount, narration):
         
         if st.button("📝 Generate Custom Entry", type="primary"):
             if abs(total_dr - total_cr) < 0.01:
-                display_journal_entry(entry_date, st.session_state.custom_entries, narration)
-                st.session_state.custom_entries = []
+                entries = [
+                    {'Account': account, 'Dr_Amount': dr, 'Cr_Amount': cr}
+                    for account, dr, cr in zip(custom['accounts'], custom['dr'], custom['cr'])
+                ]
+                display_journal_entry(entry_date, entries, narration)
+                st.session_state.custom_entries = {'accounts': [], 'dr': [], 'cr': []}
             else:
                 st.error("❌ Please ensure total debits equal total credits")
 
 def display_journal_entry(entry_date, entries, narration):
+    import pandas as pd  # deferred: keeps pandas off the cold-start import path
+    
     st.markdown("---")
     st.subheader("📋 Generated Journal Entry")
     
     # Create journal entry table
-    journal_data = []
-    total_dr = 0
-    total_cr = 0
-    
-    for entry in entries:
-        dr_amount = entry.get('Dr_Amount', 0)
-        cr_amount = entry.get('Cr_Amount', 0)
-        
-        journal_data.append({
-            'Date': entry_date.strftime('%d-%m-%Y') if journal_data == [] else '',
-            'Particulars': entry['Account'],
-            'Dr Amount (₹)': format_currency(dr_amount) if dr_amount > 0 else '',
-            'Cr Amount (₹)': format_currency(cr_amount) if cr_amount > 0 else ''
-        })
-        
-        total_dr += dr_amount
-        total_cr += cr_amount
-    
-    # Add narration row
-    journal_data.append({
-        'Date': '',
-        'Particulars': f"({narration})",
-        'Dr Amount (₹)': '',
-        'Cr Amount (₹)': ''
+    n_entries = len(entries)
+    date_str = entry_date.strftime('%d-%m-%Y')
+    accounts = [entry['Account'] for entry in entries]
+    dr = np.fromiter((entry.get('Dr_Amount', 0) for entry in entries), dtype=np.float64, count=n_entries)
+    cr = np.fromiter((entry.get('Cr_Amount', 0) for entry in entries), dtype=np.float64, count=n_entries)
+    
+    total_dr = float(dr.sum())
+    total_cr = float(cr.sum())
+    total_dr_str = format_currency(total_dr)
+    total_cr_str = format_currency(total_cr)
+    
+    # Entry rows, then the narration row and the totals row; only the first row is dated.
+    # Every column is plain strings (st.dataframe doesn't render markdown) so the
+    # totals row shares the schema and Arrow infers each column once.
+    df = pd.DataFrame({
+        'Date': [date_str] + [''] * (n_entries + 1),
+        'Particulars': accounts + [f"({narration})", 'TOTAL'],
+        'Dr Amount (₹)': [format_currency(x) if x > 0 else '' for x in dr] + ['', total_dr_str],
+        'Cr Amount (₹)': [format_currency(x) if x > 0 else '' for x in cr] + ['', total_cr_str]
     })
-    
-    # Add totals row
-    journal_data.append({
-        'Date': '',
-        'Particulars': '**TOTAL**',
-        'Dr Amount (₹)': f"**{format_currency(total_dr)}**",
-        'Cr Amount (₹)': f"**{format_currency(total_cr)}**"
-    })
-    
-    df = pd.DataFrame(journal_data)
-    st.table(df)
+    st.dataframe(df, hide_index=True, width="stretch")
     
     # Verification
     if abs(total_dr - total_cr) < 0.01:
-        st.success(f"✅ **Journal Entry is Balanced** - Dr: {format_currency(total_dr)} = Cr: {format_currency(total_cr)}")
+        st.success(f"✅ **Journal Entry is Balanced** - Dr: {total_dr_str} = Cr: {total_cr_str}")
     else:
-        st.error(f"❌ **Journal Entry is NOT Balanced** - Dr: {format_currency(total_dr)} ≠ Cr: {format_currency(total_cr)}")
+        st.error(f"❌ **Journal Entry is NOT Balanced** - Dr: {total_dr_str} ≠ Cr: {total_cr_str}")
 
-def show_journal_entry_types():
-    st.markdown("""
+_JOURNAL_ENTRY_TYPES_MD = """
     ## 📚 Types of Journal Entries
     
     ### 1. 💰 Opening Entries
@@ -764,10 +768,12 @@ def show_journal_entry_types():
     ### 8. 🧾 Credit Transactions
     - Purchases on credit, Sales on credit
     - Payments to creditors, Receipts from debtors
-    """)
+    """
 
-def show_journal_rules():
-    st.markdown("""
+def show_journal_entry_types():
+    st.markdown(_JOURNAL_ENTRY_TYPES_MD)
+
+_JOURNAL_RULES_MD = """
     ## 📖 Journal Entry Rules & Format
     
     ### Golden Rules of Accounting
@@ -812,7 +818,10 @@ def show_journal_rules():
     **Capital**: Owner's Capital, Retained Earnings
     **Income**: Sales, Interest Income, Commission Income
     **Expenses**: Rent, Salary, Electricity, Depreciation
-    """)
+    """
+
+def show_journal_rules():
+    st.markdown(_JOURNAL_RULES_MD)
 
 # ==================== GST CALCULATOR MODULE ====================
 
@@ -820,65 +829,122 @@ def show_gst_calculator():
     st.header("💰 GST Calculator")
     st.markdown("**Calculate CGST, SGST, IGST as per Indian GST Rules**")
     
-    tab1, tab2, tab3 = st.tabs(["🧮 Calculate GST", "📊 GST Rates", "📚 GST Rules"])
-    
-    with tab1:
-        calculate_gst()
-    
-    with tab2:
-        show_gst_rates()
-    
-    with tab3:
-        show_gst_rules()
+    show_section_tabs({
+        "🧮 Calculate GST": calculate_gst,
+        "📊 GST Rates": show_gst_rates,
+        "📚 GST Rules": show_gst_rules
+    }, key="gst_section")
 
+@st.fragment
 def calculate_gst():
-    st.subheader("Transaction Details")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        transaction_type = st.selectbox(
-            "Transaction Type",
-            ["Intrastate (Within State)", "Interstate (Between States)"]
-        )
+    # Inputs are batched in a form so editing them does not rerun the script until submit
+    with st.form("gst_form"):
+        st.subheader("Transaction Details")
         
-        amount_type = st.selectbox(
-            "Amount Type",
-            ["Exclusive of GST", "Inclusive of GST"]
-        )
-        
-        amount = st.number_input("Amount (₹)", min_value=0.01, value=1000.0)
-    
-    with col2:
-        gst_rate = st.selectbox(
-            "GST Rate (%)",
-            [0, 5, 12, 18, 28],
-            index=3  # Default to 18%
-        )
+        # One split for all inputs: place of supply details left, amount and rate right
+        col1, col2 = st.columns(2)
         
-        reverse_charge = st.checkbox("Reverse Charge Mechanism")
+        with col1:
+            transaction_type = st.selectbox(
+                "Transaction Type",
+                ["Intrastate (Within State)", "Interstate (Between States)"]
+            )
+            
+            from_state = st.text_input("From State", placeholder="e.g., Maharashtra")
+            to_state = st.text_input("To State", placeholder="e.g., Gujarat")
+            hsn_code = st.text_input("HSN/SAC Code", placeholder="e.g., 1001")
+            description = st.text_input("Item Description", placeholder="Description of goods/services")
         
-        if reverse_charge:
-            st.info("💡 In reverse charge, recipient pays GST")
-    
-    # Additional details
-    st.subheader("Additional Details")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        from_state = st.text_input("From State", placeholder="e.g., Maharashtra")
-        to_state = st.text_input("To State", placeholder="e.g., Gujarat")
-    
-    with col2:
-        hsn_code = st.text_input("HSN/SAC Code", placeholder="e.g., 1001")
-        description = st.text_input("Item Description", placeholder="Description of goods/services")
+        with col2:
+            amount_type = st.selectbox(
+                "Amount Type",
+                ["Exclusive of GST", "Inclusive of GST"]
+            )
+            
+            amount = st.number_input("Amount (₹)", min_value=0.01, value=1000.0)
+            
+            gst_rate = st.selectbox(
+                "GST Rate (%)",
+                _GST_RATES,
+                index=3  # Default to 18%
+            )
+            
+            reverse_charge = st.checkbox("Reverse Charge Mechanism")
+            
+            if reverse_charge:
+                st.info("💡 In reverse charge, recipient pays GST")
+            
+        submitted = st.form_submit_button("🧮 Calculate GST", type="primary")
     
-    if st.button("🧮 Calculate GST", type="primary"):
+    if submitted:
         calculate_and_display_gst(
             amount, gst_rate, amount_type, transaction_type, 
             from_state, to_state, hsn_code, description, reverse_charge
         )
 
+_JOURNAL_INTERSTATE_TMPL = """
+            **For Sales (Interstate):**
+            ```
+            Dr. Debtors/Cash                        {total}
+                To Sales                                    {basic}
+                To IGST Payable                            {igst}
+            ```
+            
+            **For Purchase (Interstate):**
+            ```
+            Dr. Purchase                            {basic}
+            Dr. IGST Input                         {igst}
+                To Creditors/Cash                          {total}
+            ```
+            """
+
+_JOURNAL_INTRASTATE_TMPL = """
+            **For Sales (Intrastate):**
+            ```
+            Dr. Debtors/Cash                        {total}
+                To Sales                                    {basic}
+                To CGST Payable                            {cgst}
+                To SGST Payable                            {sgst}
+            ```
+            
+            **For Purchase (Intrastate):**
+            ```
+            Dr. Purchase                            {basic}
+            Dr. CGST Input                         {cgst}
+            Dr. SGST Input                         {sgst}
+                To Creditors/Cash                          {total}
+            ```
+            """
+
+def _gst_summary_table(basic_amount, gst_rate, cgst, sgst, igst, gst_amount, total_amount):
+    half_rate_str = f"{gst_rate/2}%"
+    full_rate_str = f"{gst_rate}%"
+    zero_str = "0%"
+    
+    # CGST and SGST are always split evenly, so one label serves both rows
+    half_rate_label = half_rate_str if cgst > 0 else zero_str
+    igst_rate_label = full_rate_str if igst > 0 else zero_str
+    
+    return {
+        "Component": ["Basic Amount", "CGST", "SGST", "IGST", "**Total GST**", "**Grand Total**"],
+        "Amount": [
+            format_currency(basic_amount),
+            format_currency(cgst),
+            format_currency(sgst),
+            format_currency(igst),
+            f"**{format_currency(gst_amount)}**",
+            f"**{format_currency(total_amount)}**"
+        ],
+        "Rate": [
+            "-",
+            half_rate_label,
+            half_rate_label,
+            igst_rate_label,
+            f"**{full_rate_str}**",
+            "**-**"
+        ]
+    }
+
 def calculate_and_display_gst(amount, gst_rate, amount_type, transaction_type, 
                              from_state, to_state, hsn_code, description, reverse_charge):
     
@@ -894,140 +960,99 @@ def calculate_and_display_gst(amount, gst_rate, amount_type, transaction_type,
     
     # Calculate basic amount and GST
     if amount_type == "Inclusive of GST":
-        basic_amount = amount / (1 + gst_rate/100)
-        gst_amount = amount - basic_amount
+        basic_amount, gst_amount = _split_gst(amount, gst_rate)
     else:
         basic_amount = amount
         gst_amount = amount * (gst_rate/100)
     
     total_amount = basic_amount + gst_amount
     
+    # Determine GST split
+    if is_interstate:
+        igst = gst_amount
+        cgst = 0
+        sgst = 0
+    else:
+        cgst = gst_amount / 2
+        sgst = gst_amount / 2
+        igst = 0
+    
+    amount_s = format_currency(amount)
+    basic_s = format_currency(basic_amount)
+    gst_s = format_currency(gst_amount)
+    total_s = format_currency(total_amount)
+    cgst_s = format_currency(cgst)
+    sgst_s = format_currency(sgst)
+    igst_s = format_currency(igst)
+    
     # Display step-by-step calculation
     st.markdown("### 📝 Step-by-Step Calculation")
     
     if amount_type == "Inclusive of GST":
         st.markdown(f"""
         **Step 1: Extract Basic Amount from GST Inclusive Amount**
-        - GST Inclusive Amount: {format_currency(amount)}
+        - GST Inclusive Amount: {amount_s}
         - GST Rate: {gst_rate}%
-        - Basic Amount = {format_currency(amount)} ÷ (1 + {gst_rate}/100)
-        - Basic Amount = {format_currency(amount)} ÷ {1 + gst_rate/100}
-        - **Basic Amount = {format_currency(basic_amount)}**
+        - Basic Amount = {amount_s} ÷ (1 + {gst_rate}/100)
+        - Basic Amount = {amount_s} ÷ {1 + gst_rate/100}
+        - **Basic Amount = {basic_s}**
         """)
     else:
         st.markdown(f"""
         **Step 1: Basic Amount (GST Exclusive)**
-        - **Basic Amount = {format_currency(basic_amount)}**
+        - **Basic Amount = {basic_s}**
         """)
     
     st.markdown(f"""
     **Step 2: Calculate GST Amount**
-    - GST Amount = {format_currency(basic_amount)} × {gst_rate}%
-    - **GST Amount = {format_currency(gst_amount)}**
+    - GST Amount = {basic_s} × {gst_rate}%
+    - **GST Amount = {gst_s}**
     """)
     
-    # Determine GST split
     if is_interstate:
-        igst = gst_amount
-        cgst = 0
-        sgst = 0
-        
         st.markdown(f"""
         **Step 3: GST Classification (Interstate Transaction)**
         - Transaction Type: Interstate (Between {from_state or 'State A'} and {to_state or 'State B'})
-        - **IGST (100%) = {format_currency(igst)}**
-        - **CGST = {format_currency(cgst)}**
-        - **SGST = {format_currency(sgst)}**
+        - **IGST (100%) = {igst_s}**
+        - **CGST = {cgst_s}**
+        - **SGST = {sgst_s}**
         """)
     else:
-        cgst = gst_amount / 2
-        sgst = gst_amount / 2
-        igst = 0
-        
         st.markdown(f"""
         **Step 3: GST Classification (Intrastate Transaction)**
         - Transaction Type: Intrastate (Within {from_state or 'Same State'})
-        - **CGST (50%) = {format_currency(cgst)}**
-        - **SGST (50%) = {format_currency(sgst)}**
-        - **IGST = {format_currency(igst)}**
+        - **CGST (50%) = {cgst_s}**
+        - **SGST (50%) = {sgst_s}**
+        - **IGST = {igst_s}**
         """)
     
     # Summary table
     st.markdown("### 📊 GST Calculation Summary")
     
-    summary_data = [
-        {"Component": "Basic Amount", "Amount": format_currency(basic_amount), "Rate": "-"},
-        {"Component": "CGST", "Amount": format_currency(cgst), "Rate": f"{gst_rate/2}%" if cgst > 0 else "0%"},
-        {"Component": "SGST", "Amount": format_currency(sgst), "Rate": f"{gst_rate/2}%" if sgst > 0 else "0%"},
-        {"Component": "IGST", "Amount": format_currency(igst), "Rate": f"{gst_rate}%" if igst > 0 else "0%"},
-        {"Component": "**Total GST**", "Amount": f"**{format_currency(gst_amount)}**", "Rate": f"**{gst_rate}%**"},
-        {"Component": "**Grand Total**", "Amount": f"**{format_currency(total_amount)}**", "Rate": "**-**"}
-    ]
-    
-    df_summary = pd.DataFrame(summary_data)
-    st.table(df_summary)
+    st.table(_gst_summary_table(basic_amount, gst_rate, cgst, sgst, igst, gst_amount, total_amount))
     
     # Journal entries for GST
     if not reverse_charge:
         st.markdown("### 📝 Journal Entries")
         
-        if is_interstate:
-            # Interstate transaction
-            journal_entries = f"""
-            **For Sales (Interstate):**
-            ```
-            Dr. Debtors/Cash                        {format_currency(total_amount)}
-                To Sales                                    {format_currency(basic_amount)}
-                To IGST Payable                            {format_currency(igst)}
-            ```
-            
-            **For Purchase (Interstate):**
-            ```
-            Dr. Purchase                            {format_currency(basic_amount)}
-            Dr. IGST Input                         {format_currency(igst)}
-                To Creditors/Cash                          {format_currency(total_amount)}
-            ```
-            """
-        else:
-            # Intrastate transaction
-            journal_entries = f"""
-            **For Sales (Intrastate):**
-            ```
-            Dr. Debtors/Cash                        {format_currency(total_amount)}
-                To Sales                                    {format_currency(basic_amount)}
-                To CGST Payable                            {format_currency(cgst)}
-                To SGST Payable                            {format_currency(sgst)}
-            ```
-            
-            **For Purchase (Intrastate):**
-            ```
-            Dr. Purchase                            {format_currency(basic_amount)}
-            Dr. CGST Input                         {format_currency(cgst)}
-            Dr. SGST Input                         {format_currency(sgst)}
-                To Creditors/Cash                          {format_currency(total_amount)}
-            ```
-            """
+        template = _JOURNAL_INTERSTATE_TMPL if is_interstate else _JOURNAL_INTRASTATE_TMPL
+        journal_entries = template.format(
+            total=total_s, basic=basic_s, cgst=cgst_s, sgst=sgst_s, igst=igst_s
+        )
         
         st.markdown(journal_entries)
     else:
         st.info("💡 **Reverse Charge:** GST will be paid by the recipient as per reverse charge mechanism rules.")
 
-def show_gst_rates():
-    st.markdown("## 📊 Standard GST Rates in India")
-    
-    # Create GST rates table
-    gst_rates_data = [
-        {"Rate": "0%", "Category": "Exempted", "Examples": "Basic food items, Books, Newspapers"},
-        {"Rate": "5%", "Category": "Essential Items", "Examples": "Sugar, Tea, Coffee, Medicines"},
-        {"Rate": "12%", "Category": "Standard Items", "Examples": "Mobile phones, Computers, Processed food"},
-        {"Rate": "18%", "Category": "Standard Items", "Examples": "Most goods and services, Electronics"},
-        {"Rate": "28%", "Category": "Luxury Items", "Examples": "Cars, Cigarettes, Luxury goods"}
-    ]
-    
-    df_rates = pd.DataFrame(gst_rates_data)
-    st.table(df_rates)
-    
-    st.markdown("""
+_GST_RATES_DATA = (
+    {"Rate": "0%", "Category": "Exempted", "Examples": "Basic food items, Books, Newspapers"},
+    {"Rate": "5%", "Category": "Essential Items", "Examples": "Sugar, Tea, Coffee, Medicines"},
+    {"Rate": "12%", "Category": "Standard Items", "Examples": "Mobile phones, Computers, Processed food"},
+    {"Rate": "18%", "Category": "Standard Items", "Examples": "Most goods and services, Electronics"},
+    {"Rate": "28%", "Category": "Luxury Items", "Examples": "Cars, Cigarettes, Luxury goods"}
+)
+
+_GST_RATES_INFO_MD = """
     ### 🏢 GST Registration Limits
     
     - **Regular Business**: ₹40 Lakhs annual turnover
@@ -1048,10 +1073,22 @@ def show_gst_rates():
     - Cannot claim ITC on personal use items
     - Must have valid tax invoice
     - Supplier should have filed returns
-    """)
+    """
 
-def show_gst_rules():
-    st.markdown("""
+@st.cache_data
+def _gst_rates_table():
+    import pandas as pd
+    
+    return pd.DataFrame(_GST_RATES_DATA)
+
+def show_gst_rates():
+    st.markdown("## 📊 Standard GST Rates in India")
+    
+    st.table(_gst_rates_table())
+    
+    st.markdown(_GST_RATES_INFO_MD)
+
+_GST_RULES_MD = """
     ## 📚 GST Rules & Concepts
     
     ### 🎯 What is GST?
@@ -1126,7 +1163,10 @@ def show_gst_rules():
     - **Transparent system**
     - **Increased compliance**
     - **Easy interstate trade**
-    """)
+    """
+
+def show_gst_rules():
+    st.markdown(_GST_RULES_MD)
 
 # ==================== MAIN APPLICATION ====================
 
@@ -1139,10 +1179,10 @@ def main():
     st.sidebar.title("📚 Accounting Topics")
     
     topics = {
-        "🏠 Home": "home",
-        "📐 Accounting Equations": "equations",
-        "📝 Journal Entries": "journal",
-        "💰 GST Calculator": "gst"
+        "🏠 Home": show_home_page,
+        "📐 Accounting Equations": show_accounting_equations,
+        "📝 Journal Entries": show_journal_entries,
+        "💰 GST Calculator": show_gst_calculator
     }
     
     selected_topic = st.sidebar.selectbox(
@@ -1151,33 +1191,16 @@ def main():
         index=0
     )
     
-    topic_key = topics[selected_topic]
-    
     # Main content area
-    if topic_key == "home":
-        show_home_page()
-    elif topic_key == "equations":
-        show_accounting_equations()
-    elif topic_key == "journal":
-        show_journal_entries()
-    elif topic_key == "gst":
-        show_gst_calculator()
+    topics[selected_topic]()
 
-def show_home_page():
-    st.markdown("---")
-    
-    # Welcome section
-    st.markdown("""
+_HOME_WELCOME_MD = """
     ## Welcome to Your AI Accounting Assistant! 🎓
     
     This comprehensive tool helps you solve and understand various Indian accounting concepts with step-by-step explanations.
-    """)
-    
-    # Features grid
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.markdown("""
+    """
+
+_HOME_COL1_MD = """
         ### 📐 Accounting Equations
         - Solve basic accounting equations
         - Asset = Liability + Capital
@@ -1187,30 +1210,25 @@ def show_home_page():
         - CGST + SGST (Intrastate)
         - IGST (Interstate)
         - Rate-wise calculations
-        """)
-    
-    with col2:
-        st.markdown("""
+        """
+
+_HOME_COL2_MD = """
         ### 📝 Journal Entries
         - Opening entries
         - Adjustment entries
         - Rectification entries
         - Closing entries
-        """)
-    
-    with col3:
-        st.markdown("""
+        """
+
+_HOME_COL3_MD = """
         ### 🎯 Educational Focus
         - CBSE Class 11-12 curriculum
         - CA Foundation preparation
         - Step-by-step explanations
         - Indian accounting standards
-        """)
-    
-    st.markdown("---")
-    
-    # Quick start guide
-    st.markdown("""
+        """
+
+_HOME_QUICKSTART_MD = """
     ## 🚀 Quick Start Guide
     
     1. **Select a topic** from the sidebar menu
@@ -1219,15 +1237,40 @@ def show_home_page():
     4. **Export results** as needed for your studies
     
     All solutions follow **CBSE/ICAI format** with proper Indian accounting standards.
-    """)
-    
-    # Sample problems section
-    with st.expander("📚 Sample Problems Available"):
-        st.markdown("""
+    """
+
+_HOME_SAMPLES_MD = """
         - **Accounting Equations**: Find missing values in A = L + C
         - **Journal Entries**: Record business transactions properly
         - **GST Calculations**: Calculate tax for different scenarios
-        """)
+        """
+
+def show_home_page():
+    st.markdown("---")
+    
+    # Welcome section
+    st.markdown(_HOME_WELCOME_MD)
+    
+    # Features grid
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(_HOME_COL1_MD)
+    
+    with col2:
+        st.markdown(_HOME_COL2_MD)
+    
+    with col3:
+        st.markdown(_HOME_COL3_MD)
+    
+    st.markdown("---")
+    
+    # Quick start guide
+    st.markdown(_HOME_QUICKSTART_MD)
+    
+    # Sample problems section
+    with st.expander("📚 Sample Problems Available"):
+        st.markdown(_HOME_SAMPLES_MD)
 
 if __name__ == "__main__":
     main()